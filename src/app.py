@@ -5,44 +5,96 @@ A FastAPI application that enables Slalom consultants to register their
 capabilities and manage consulting expertise across the organization.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, status
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import bcrypt
-from jose import JWTError, jwt
-from datetime import datetime, timedelta
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
+import jwt
+from jwt.exceptions import InvalidTokenError as JWTError
+from datetime import timedelta
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import logging.handlers
+import queue
+import sys
 import os
-import json
-from pathlib import Path
+import orjson
+import hashlib
+import threading
+import time
+from contextlib import asynccontextmanager
 from typing import Optional, List
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the roster and its dummy hash before serving; a no-op when gunicorn already preloaded them
+    get_dummy_hash(get_practice_leads())
+    audit_listener.start()
+    try:
+        yield
+    finally:
+        audit_listener.stop()
+
 app = FastAPI(title="Slalom Capabilities Management API",
-              description="API for managing consulting capabilities and consultant expertise")
+              description="API for managing consulting capabilities and consultant expertise",
+              lifespan=lifespan)
+
+# CORS middleware: the dashboard is served from this app, so only the listed origins
+# need cross-origin access. Auth uses a bearer header, not cookies.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("CORS_ORIGINS", "https://app.slalom.com").split(",")
+    if origin.strip()
+]
 
-# CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,
 )
 
+# File locations, resolved once at import
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(CURRENT_DIR, "static")
+PRACTICE_LEADS_PATH = os.path.join(CURRENT_DIR, "practice_leads.json")
+
 # Mount the static files directory
-current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+logger = logging.getLogger(__name__)
+
+# Audit log: request handlers only enqueue records, a background thread writes them to stdout.
+# The listener is started per process in lifespan, since its thread doesn't survive a fork.
+audit_queue = queue.SimpleQueue()
+audit_listener = logging.handlers.QueueListener(audit_queue, logging.StreamHandler(sys.stdout))
+
+audit_logger = logging.getLogger("audit")
+audit_logger.setLevel(logging.INFO)
+audit_logger.propagate = False
+audit_logger.addHandler(logging.handlers.QueueHandler(audit_queue))
 
 # Security configurations
-SECRET_KEY = "slalom-capabilities-secret-key-change-in-production"
+SECRET_KEY = os.environ.get("SECRET_KEY", "slalom-capabilities-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 480  # 8 hours
+MAX_BATCH_REGISTRATIONS = 100
 
 security = HTTPBearer(auto_error=False)
 
+# Decoded JWT payloads keyed by raw token; entries are also checked against "exp" on read
+_token_cache_lock = threading.Lock()
+_decoded_tokens = TTLCache(maxsize=4096, ttl=60)
+
 # Pydantic models
 class LoginRequest(BaseModel):
     username: str
@@ -60,6 +112,9 @@ class Token(BaseModel):
     token_type: str
     user: UserResponse
 
+class BatchRegisterRequest(BaseModel):
+    emails: List[str]
+
 # In-memory capabilities database
 capabilities = {
     "Cloud Architecture": {
@@ -69,7 +124,7 @@ capabilities = {
         "certifications": ["AWS Solutions Architect", "Azure Architect Expert"],
         "industry_verticals": ["Healthcare", "Financial Services", "Retail"],
         "capacity": 40,  # hours per week available across team
-        "consultants": ["alice.smith@slalom.com", "bob.johnson@slalom.com"]
+        "consultants": {"alice.smith@slalom.com", "bob.johnson@slalom.com"}
     },
     "Data Analytics": {
         "description": "Advanced data analysis, visualization, and machine learning solutions",
@@ -78,7 +133,7 @@ capabilities = {
         "certifications": ["Tableau Desktop Specialist", "Power BI Expert", "Google Analytics"],
         "industry_verticals": ["Retail", "Healthcare", "Manufacturing"],
         "capacity": 35,
-        "consultants": ["emma.davis@slalom.com", "sophia.wilson@slalom.com"]
+        "consultants": {"emma.davis@slalom.com", "sophia.wilson@slalom.com"}
     },
     "DevOps Engineering": {
         "description": "CI/CD pipeline design, infrastructure automation, and containerization",
@@ -87,7 +142,7 @@ capabilities = {
         "certifications": ["Docker Certified Associate", "Kubernetes Admin", "Jenkins Certified"],
         "industry_verticals": ["Technology", "Financial Services"],
         "capacity": 30,
-        "consultants": ["john.brown@slalom.com", "olivia.taylor@slalom.com"]
+        "consultants": {"john.brown@slalom.com", "olivia.taylor@slalom.com"}
     },
     "Digital Strategy": {
         "description": "Digital transformation planning and strategic technology roadmaps",
@@ -96,7 +151,7 @@ capabilities = {
         "certifications": ["Digital Transformation Certificate", "Agile Certified Practitioner"],
         "industry_verticals": ["Healthcare", "Financial Services", "Government"],
         "capacity": 25,
-        "consultants": ["liam.anderson@slalom.com", "noah.martinez@slalom.com"]
+        "consultants": {"liam.anderson@slalom.com", "noah.martinez@slalom.com"}
     },
     "Change Management": {
         "description": "Organizational change leadership and adoption strategies",
@@ -105,7 +160,7 @@ capabilities = {
         "certifications": ["Prosci Certified", "Lean Six Sigma Black Belt"],
         "industry_verticals": ["Healthcare", "Manufacturing", "Government"],
         "capacity": 20,
-        "consultants": ["ava.garcia@slalom.com", "mia.rodriguez@slalom.com"]
+        "consultants": {"ava.garcia@slalom.com", "mia.rodriguez@slalom.com"}
     },
     "UX/UI Design": {
         "description": "User experience design and digital product innovation",
@@ -114,7 +169,7 @@ capabilities = {
         "certifications": ["Adobe Certified Expert", "Google UX Design Certificate"],
         "industry_verticals": ["Retail", "Healthcare", "Technology"],
         "capacity": 30,
-        "consultants": ["amelia.lee@slalom.com", "harper.white@slalom.com"]
+        "consultants": {"amelia.lee@slalom.com", "harper.white@slalom.com"}
     },
     "Cybersecurity": {
         "description": "Information security strategy, risk assessment, and compliance",
@@ -123,7 +178,7 @@ capabilities = {
         "certifications": ["CISSP", "CISM", "CompTIA Security+"],
         "industry_verticals": ["Financial Services", "Healthcare", "Government"],
         "capacity": 25,
-        "consultants": ["ella.clark@slalom.com", "scarlett.lewis@slalom.com"]
+        "consultants": {"ella.clark@slalom.com", "scarlett.lewis@slalom.com"}
     },
     "Business Intelligence": {
         "description": "Enterprise reporting, data warehousing, and business analytics",
@@ -132,7 +187,7 @@ capabilities = {
         "certifications": ["Microsoft BI Certification", "Qlik Sense Certified"],
         "industry_verticals": ["Retail", "Manufacturing", "Financial Services"],
         "capacity": 35,
-        "consultants": ["james.walker@slalom.com", "benjamin.hall@slalom.com"]
+        "consultants": {"james.walker@slalom.com", "benjamin.hall@slalom.com"}
     },
     "Agile Coaching": {
         "description": "Agile transformation and team coaching for scaled delivery",
@@ -141,45 +196,153 @@ capabilities = {
         "certifications": ["Certified Scrum Master", "SAFe Agilist", "ICAgile Certified"],
         "industry_verticals": ["Technology", "Financial Services", "Healthcare"],
         "capacity": 20,
-        "consultants": ["charlotte.young@slalom.com", "henry.king@slalom.com"]
+        "consultants": {"charlotte.young@slalom.com", "henry.king@slalom.com"}
     }
 }
 
-# Load practice leads data
+def normalize_key(value: str) -> str:
+    return value.strip().casefold()
+
+# Lookup index so capability names match regardless of case or surrounding whitespace.
+# Maps the normalized name to (canonical name, capability).
+capabilities_by_name = {normalize_key(name): (name, capability) for name, capability in capabilities.items()}
+
+# Pre-serialized GET /capabilities body and its ETag, rebuilt whenever consultants change
+capabilities_body = b""
+capabilities_etag = ""
+
+def refresh_capabilities_cache():
+    global capabilities_body, capabilities_etag
+    capabilities_body = orjson.dumps({
+        name: {**capability, "consultants": sorted(capability["consultants"])}
+        for name, capability in capabilities.items()
+    })
+    capabilities_etag = f'"{hashlib.sha256(capabilities_body).hexdigest()[:32]}"'
+
+refresh_capabilities_cache()
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header (list, W/ prefix or *) against an ETag"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+# Load practice leads data, keyed by normalized username
 def load_practice_leads():
     try:
-        with open(os.path.join(current_dir, "practice_leads.json"), "r") as file:
-            data = json.load(file)
-            return {user["username"]: user for user in data["practice_leads"]}
+        with open(PRACTICE_LEADS_PATH, "rb", buffering=65536) as file:
+            data = orjson.loads(file.read())
+        users = {}
+        for user in data["practice_leads"]:
+            key = normalize_key(user["username"])
+            if key in users:
+                logger.warning("Skipping practice lead %r: username already used by %r",
+                               user["username"], users[key]["username"])
+                continue
+            # Derived fields for O(1) permission checks and the pre-encoded /auth/me body
+            user["_practice_areas_set"] = frozenset(user["practice_areas"])
+            user["_is_admin"] = user["role"] == "admin"
+            user["_response_body"] = orjson.dumps({
+                "username": user["username"],
+                "email": user["email"],
+                "role": user["role"],
+                "practice_areas": user["practice_areas"],
+                "full_name": user["full_name"],
+            })
+            users[key] = user
+        return users
     except FileNotFoundError:
         return {}
 
-practice_leads = load_practice_leads()
+@functools.lru_cache(maxsize=1)
+def get_practice_leads():
+    """Load the practice leads roster on first use and reuse it afterwards"""
+    return load_practice_leads()
+
+# Argon2id parameters follow the OWASP minimum (19 MiB, 2 iterations).
+# Rosters that still hold bcrypt hashes are verified with bcrypt; hashes are never rewritten in memory.
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Password hashing is CPU-bound, so it runs on its own pool instead of the event loop
+PASSWORD_HASH_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="password-hash"
+)
+
+# Short-lived cache of password check results, keyed by (normalized username, digest of hash and password).
+# The username keeps unknown users, which all share the dummy hash, from sharing cache entries.
+# Failed attempts expire quickly so cached rejections can't amplify guessing.
+_password_cache_lock = threading.Lock()
+_verified_passwords = TTLCache(maxsize=1024, ttl=60)
+_rejected_passwords = TTLCache(maxsize=1024, ttl=5)
 
 # Authentication functions
-def verify_password(plain_password, hashed_password):
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+def verify_password(plain_password, hashed_password, username=""):
+    key = (normalize_key(username), hashlib.sha256(
+        hashed_password.encode('utf-8') + b"\0" + plain_password.encode('utf-8')
+    ).digest())
+    with _password_cache_lock:
+        if key in _verified_passwords:
+            return True
+        if key in _rejected_passwords:
+            return False
+
+    if is_legacy_hash(hashed_password):
+        try:
+            result = bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+        except ValueError:
+            # bcrypt rejects passwords longer than 72 bytes; treat them as a failed check
+            result = False
+    else:
+        try:
+            result = password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            result = False
+
+    with _password_cache_lock:
+        if result:
+            _verified_passwords[key] = True
+        else:
+            _rejected_passwords[key] = False
+    return result
+
+def is_legacy_hash(hashed_password):
+    return hashed_password.startswith(("$2a$", "$2b$", "$2y$"))
 
 def get_password_hash(password):
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return password_hasher.hash(password)
+
+# Verified against when the username is unknown so response time doesn't reveal valid users.
+# It has to match the scheme and cost of the stored hashes, so a bcrypt roster gets a bcrypt dummy.
+DUMMY_HASH = get_password_hash(os.urandom(16).hex())
+
+@functools.lru_cache(maxsize=None)
+def get_legacy_dummy_hash(cost: int):
+    return bcrypt.hashpw(os.urandom(16), bcrypt.gensalt(cost)).decode('utf-8')
+
+def get_dummy_hash(users: dict):
+    for user in users.values():
+        if is_legacy_hash(user["password_hash"]):
+            return get_legacy_dummy_hash(int(user["password_hash"][4:6]))
+    return DUMMY_HASH
 
 def authenticate_user(username: str, password: str):
-    user = practice_leads.get(username)
-    if not user:
-        return False
-    if not verify_password(password, user["password_hash"]):
+    users = get_practice_leads()
+    user = users.get(normalize_key(username))
+    target_hash = user["password_hash"] if user else get_dummy_hash(users)
+    password_ok = verify_password(password, target_hash, username)
+    if not (bool(user) & password_ok):
         return False
     return user
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+def create_access_token(sub: str, expires_delta: Optional[timedelta] = None):
+    if not expires_delta:
+        expires_delta = timedelta(minutes=15)
+    expire = int(time.time()) + int(expires_delta.total_seconds())
+    return jwt.encode({"sub": sub, "exp": expire}, SECRET_KEY, algorithm=ALGORITHM)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     credentials_exception = HTTPException(
@@ -191,15 +354,28 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     if not credentials:
         raise credentials_exception
         
+    token = credentials.credentials
+    with _token_cache_lock:
+        payload = _decoded_tokens.get(token)
+    if payload is not None and payload.get("exp", 0) <= time.time():
+        with _token_cache_lock:
+            _decoded_tokens.pop(token, None)
+        raise credentials_exception
+
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        if payload is None:
+            payload = jwt.decode(
+                token, SECRET_KEY, algorithms=[ALGORITHM], options={"require": ["exp", "sub"]}
+            )
+            with _token_cache_lock:
+                _decoded_tokens[token] = payload
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
         
-    user = practice_leads.get(username)
+    user = get_practice_leads().get(normalize_key(username))
     if user is None:
         raise credentials_exception
     return user
@@ -212,14 +388,19 @@ async def get_current_practice_lead(current_user: dict = Depends(get_current_use
         )
     return current_user
 
+def can_manage_practice_area(user: dict, practice_area: str) -> bool:
+    return user["_is_admin"] or practice_area in user["_practice_areas_set"]
+
 
 @app.get("/")
-def root():
+async def root():
     return RedirectResponse(url="/static/index.html")
 
 @app.post("/auth/login", response_model=Token)
 async def login(login_request: LoginRequest):
-    user = authenticate_user(login_request.username, login_request.password)
+    user = await asyncio.get_running_loop().run_in_executor(
+        PASSWORD_HASH_POOL, authenticate_user, login_request.username, login_request.password
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -228,7 +409,7 @@ async def login(login_request: LoginRequest):
         )
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user["username"]}, expires_delta=access_token_expires
+        sub=user["username"], expires_delta=access_token_expires
     )
     
     user_response = UserResponse(
@@ -245,38 +426,38 @@ async def login(login_request: LoginRequest):
         "user": user_response
     }
 
-@app.get("/auth/me", response_model=UserResponse)
+@app.get("/auth/me", responses={200: {"model": UserResponse}})
 async def read_users_me(current_user: dict = Depends(get_current_user)):
-    return UserResponse(
-        username=current_user["username"],
-        email=current_user["email"],
-        role=current_user["role"],
-        practice_areas=current_user["practice_areas"],
-        full_name=current_user["full_name"]
-    )
+    return Response(current_user["_response_body"], media_type="application/json")
 
 @app.post("/auth/logout")
-async def logout():
+async def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    if credentials:
+        with _token_cache_lock:
+            _decoded_tokens.pop(credentials.credentials, None)
     return {"message": "Successfully logged out"}
 
 
 @app.get("/capabilities")
-def get_capabilities():
-    return capabilities
+async def get_capabilities(request: Request):
+    # no-cache makes browsers revalidate, so changes show up right after a register/unregister
+    headers = {"ETag": capabilities_etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), capabilities_etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(capabilities_body, media_type="application/json", headers=headers)
 
 
 @app.post("/capabilities/{capability_name}/register")
-def register_for_capability(capability_name: str, email: str, current_user: dict = Depends(get_current_practice_lead)):
+async def register_for_capability(capability_name: str, email: str, current_user: dict = Depends(get_current_practice_lead)):
     """Register a consultant for a capability (Practice Lead only)"""
     # Validate capability exists
-    if capability_name not in capabilities:
+    entry = capabilities_by_name.get(normalize_key(capability_name))
+    if entry is None:
         raise HTTPException(status_code=404, detail="Capability not found")
-
-    # Get the specific capability
-    capability = capabilities[capability_name]
+    name, capability = entry
     
     # Check if practice lead has permission for this capability's practice area
-    if current_user["role"] != "admin" and capability["practice_area"] not in current_user["practice_areas"]:
+    if not can_manage_practice_area(current_user, capability["practice_area"]):
         raise HTTPException(
             status_code=403, 
             detail=f"You don't have permission to manage {capability['practice_area']} capabilities"
@@ -290,26 +471,80 @@ def register_for_capability(capability_name: str, email: str, current_user: dict
         )
 
     # Add consultant
-    capability["consultants"].append(email)
+    capability["consultants"].add(email)
+    refresh_capabilities_cache()
     
     # Audit log
-    print(f"AUDIT: {current_user['username']} registered {email} for {capability_name}")
+    audit_logger.info(
+        "AUDIT: %s registered %s for %s", current_user["username"], email, name,
+        extra={"actor": current_user["username"], "target": email, "capability": name},
+    )
     
-    return {"message": f"Registered {email} for {capability_name}"}
+    return {"message": f"Registered {email} for {name}"}
+
+
+@app.post("/capabilities/{capability_name}/register:batch")
+async def batch_register_for_capability(capability_name: str, batch_request: BatchRegisterRequest, current_user: dict = Depends(get_current_practice_lead)):
+    """Register several consultants for a capability in one request (Practice Lead only)"""
+    if len(batch_request.emails) > MAX_BATCH_REGISTRATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_REGISTRATIONS} consultants can be registered per request"
+        )
+
+    # Validate capability exists
+    entry = capabilities_by_name.get(normalize_key(capability_name))
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Capability not found")
+    name, capability = entry
+
+    # Check if practice lead has permission for this capability's practice area
+    if not can_manage_practice_area(current_user, capability["practice_area"]):
+        raise HTTPException(
+            status_code=403, 
+            detail=f"You don't have permission to manage {capability['practice_area']} capabilities"
+        )
+
+    # Skip consultants that are already registered, and repeats within the batch
+    existing = capability["consultants"]
+    added = set()
+    registered = []
+    skipped = []
+    for email in batch_request.emails:
+        if email in existing or email in added:
+            skipped.append(email)
+        else:
+            added.add(email)
+            registered.append(email)
+
+    if registered:
+        existing.update(added)
+        refresh_capabilities_cache()
+
+        # Audit log
+        audit_logger.info(
+            "AUDIT: %s registered %s for %s", current_user["username"], ", ".join(registered), name,
+            extra={"actor": current_user["username"], "target": registered, "capability": name},
+        )
+
+    return {
+        "message": f"Registered {len(registered)} consultants for {name}",
+        "registered": registered,
+        "skipped": skipped,
+    }
 
 
 @app.delete("/capabilities/{capability_name}/unregister")
-def unregister_from_capability(capability_name: str, email: str, current_user: dict = Depends(get_current_practice_lead)):
+async def unregister_from_capability(capability_name: str, email: str, current_user: dict = Depends(get_current_practice_lead)):
     """Unregister a consultant from a capability (Practice Lead only)"""
     # Validate capability exists
-    if capability_name not in capabilities:
+    entry = capabilities_by_name.get(normalize_key(capability_name))
+    if entry is None:
         raise HTTPException(status_code=404, detail="Capability not found")
-
-    # Get the specific capability
-    capability = capabilities[capability_name]
+    name, capability = entry
     
     # Check if practice lead has permission for this capability's practice area
-    if current_user["role"] != "admin" and capability["practice_area"] not in current_user["practice_areas"]:
+    if not can_manage_practice_area(current_user, capability["practice_area"]):
         raise HTTPException(
             status_code=403, 
             detail=f"You don't have permission to manage {capability['practice_area']} capabilities"
@@ -324,19 +559,25 @@ def unregister_from_capability(capability_name: str, email: str, current_user: d
 
     # Remove consultant
     capability["consultants"].remove(email)
+    refresh_capabilities_cache()
     
     # Audit log
-    print(f"AUDIT: {current_user['username']} unregistered {email} from {capability_name}")
+    audit_logger.info(
+        "AUDIT: %s unregistered %s from %s", current_user["username"], email, name,
+        extra={"actor": current_user["username"], "target": email, "capability": name},
+    )
     
-    return {"message": f"Unregistered {email} from {capability_name}"}
+    return {"message": f"Unregistered {email} from {name}"}
 
 @app.post("/capabilities/{capability_name}/request")
-def request_capability_registration(capability_name: str, email: str):
+async def request_capability_registration(capability_name: str, email: str):
     """Request to register for a capability (Consultant self-service)"""
     # Validate capability exists
-    if capability_name not in capabilities:
+    entry = capabilities_by_name.get(normalize_key(capability_name))
+    if entry is None:
         raise HTTPException(status_code=404, detail="Capability not found")
+    name, _ = entry
     
     # This would normally integrate with an approval workflow
     # For now, we'll just return a pending status
-    return {"message": f"Registration request submitted for {email} in {capability_name}. Awaiting practice lead approval."}
+    return {"message": f"Registration request submitted for {email} in {name}. Awaiting practice lead approval."}
@@ -0,0 +1,27 @@
+"""
+Gunicorn settings for running the Slalom Capabilities Management API in production.
+
+Usage (from the src directory):
+    gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+
+# Capabilities and registrations live in process memory, so every worker would hold its own copy.
+# Keep a single worker until that state moves to a shared store.
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+# UvicornWorker picks uvloop and httptools automatically when uvicorn[standard] is installed
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the preload and before workers are forked
+    from app import get_dummy_hash, get_practice_leads
+
+    get_dummy_hash(get_practice_leads())